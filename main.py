@@ -1,26 +1,79 @@
 import streamlit as st
-from langchain_groq import ChatGroq
-from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableSequence
-from langchain_core.output_parsers import StrOutputParser
 import os
 from datetime import datetime
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from io import BytesIO
+from html import escape
 
-# Page configuration
-st.set_page_config(
-    page_title="ATS Resume Generator",
-    page_icon="📄",
-    layout="wide"
-)
+# Groq and ReportLab are imported inside the functions that use them so
+# the first page render does not pay their import cost
 
-# Custom CSS for better styling
-st.markdown("""
+# Resume prompt: invariant instructions go in the system message so the
+# provider can reuse the cached prefix; only the user message (filled with
+# str.format) varies
+RESUME_SYSTEM_PROMPT = """You are an expert resume writer specializing in ATS (Applicant Tracking System) optimization.
+Write a plain-text resume in exactly this layout, using only the candidate details you are given:
+
+FULL NAME IN ALL CAPS
+Contact line, copied exactly as given
+
+PROFESSIONAL SUMMARY
+2-4 lines for the target role; write one from the job description if none is provided
+
+CORE SKILLS
+Skill1 · Skill2 · Skill3 (skills matching the job description first)
+
+PROFESSIONAL EXPERIENCE
+Job Title — Company Name
+Location | MM/YYYY – Present (or MM/YYYY – MM/YYYY)
+• 3-4 achievement bullets with metrics
+
+PROJECTS
+Project Name — Role
+• Technologies used, key features and results
+
+EDUCATION
+Degree — University Name
+MM/YYYY – MM/YYYY (or Expected MM/YYYY)
+
+CERTIFICATIONS
+Certification1 · Certification2
+
+ACHIEVEMENTS
+• Significant achievements, rankings, or recognitions (only if notable ones exist)
+
+Rules:
+- Section headers in ALL CAPS, each preceded by a blank line
+- No tables, columns, icons, or graphics; the only special characters are · — | •
+- Work job description keywords in naturally
+- Start bullets with action verbs (Built, Developed, Led, Improved) and quantify results (%, $, users, time saved)
+- Keep each bullet to 1-2 lines"""
+
+RESUME_USER_TEMPLATE = """Target job title: {job_title}
+
+Job description:
+{job_description}
+
+Name: {full_name}
+Contact: {contact_line}
+Professional summary: {professional_summary}
+
+Skills:
+{skills}
+
+Work experience:
+{work_experience}
+
+Projects:
+{projects}
+
+Education:
+{education}
+
+Certifications: {certifications}"""
+
+# Custom CSS, emitted on every run: Streamlit removes elements a rerun
+# doesn't re-emit, so guarding this with session state would drop the styles
+CSS_BLOCK = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -42,7 +95,17 @@ st.markdown("""
         font-size: 14px;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="ATS Resume Generator",
+    page_icon="📄",
+    layout="wide"
+)
+
+# Custom CSS for better styling
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # Title
 st.markdown('<div class="main-header">🤖 AI-Powered ATS Resume Generator</div>', unsafe_allow_html=True)
@@ -53,6 +116,10 @@ if 'resume_generated' not in st.session_state:
     st.session_state.resume_generated = False
 if 'generated_resume' not in st.session_state:
     st.session_state.generated_resume = ""
+if 'pdf_key' not in st.session_state:
+    st.session_state.pdf_key = None
+if 'pdf_bytes' not in st.session_state:
+    st.session_state.pdf_bytes = b""
 
 # Sidebar for API Key
 with st.sidebar:
@@ -87,34 +154,83 @@ if not groq_api_key:
     st.warning("⚠️ Please enter your GROQ API key in the sidebar to continue")
     st.stop()
 
-# Initialize LLM
-try:
-    llm = ChatGroq(
+MODEL_NAME = "llama-3.3-70b-versatile"
+
+# Replies that mean the request was blocked by GROQ's content moderation
+MODERATION_OUTPUTS = ('safe', 'unsafe', '')
+
+def is_moderation_output(text):
+    return text.strip().lower() in MODERATION_OUTPUTS
+
+# Build the Groq client once per API key instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def get_client(api_key):
+    from groq import Groq
+    
+    return Groq(api_key=api_key)
+
+# Completed resumes keyed on (model, prompt inputs), kept in memory for a
+# day. The body only runs on a cache miss: without a resume it raises
+# (exceptions are not cached), and right after streaming it is called with
+# the finished text, which Streamlit leaves out of the key.
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def saved_resume(model, input_items, _resume=None):
+    if _resume is None:
+        raise KeyError(model)
+    return _resume
+
+# Yield the text of each streamed completion chunk
+def stream_text(stream):
+    for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+# Stream a resume into the placeholder as tokens arrive; identical inputs are
+# served from saved_resume. The streaming itself can't live in a st.cache_data
+# function because it would replay the placeholder updates, which live
+# outside the function.
+def generate_resume(api_key, model, input_items, placeholder):
+    try:
+        return saved_resume(model, input_items)
+    except KeyError:
+        pass
+    
+    messages = [
+        {"role": "system", "content": RESUME_SYSTEM_PROMPT},
+        {"role": "user", "content": RESUME_USER_TEMPLATE.format(**dict(input_items))}
+    ]
+    stream = get_client(api_key).chat.completions.create(
+        model=model,
+        messages=messages,
         temperature=0.7,
-        model_name="llama-3.3-70b-versatile",
-        groq_api_key=groq_api_key
+        stream=True
     )
-except Exception as e:
-    st.error(f"Error initializing GROQ API: {str(e)}")
-    st.stop()
-
-# Function to create PDF from resume text
-def create_pdf(resume_text, full_name):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                           rightMargin=0.75*inch, leftMargin=0.75*inch,
-                           topMargin=0.75*inch, bottomMargin=0.75*inch)
     
-    # Container for the 'Flowable' objects
-    elements = []
+    # The preview is cleared even if the stream fails partway, so a
+    # half-written resume isn't left above the error message
+    try:
+        resume_output = placeholder.write_stream(stream_text(stream))
+    finally:
+        placeholder.empty()
+    
+    # Moderation answers and empty output are left for the caller to reject
+    # and never cached, so the next click asks the model again
+    if is_moderation_output(resume_output):
+        return resume_output
+    
+    return saved_resume(model, input_items, resume_output)
+
+# PDF paragraph styles, built once per server process instead of per PDF
+@st.cache_resource(show_spinner=False)
+def get_pdf_styles():
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER
     
-    # Define styles
-    styles = getSampleStyleSheet()
+    sample_styles = getSampleStyleSheet()
     
-    # Custom styles for resume
     name_style = ParagraphStyle(
         'NameStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=18,
         textColor='#000000',
         spaceAfter=4,
@@ -125,7 +241,7 @@ def create_pdf(resume_text, full_name):
     
     contact_style = ParagraphStyle(
         'ContactStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=9,
         textColor='#333333',
         spaceAfter=12,
@@ -135,7 +251,7 @@ def create_pdf(resume_text, full_name):
     
     heading_style = ParagraphStyle(
         'HeadingStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=11,
         textColor='#000000',
         spaceAfter=8,
@@ -146,7 +262,7 @@ def create_pdf(resume_text, full_name):
     
     subheading_style = ParagraphStyle(
         'SubheadingStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=10,
         textColor='#000000',
         spaceAfter=2,
@@ -157,9 +273,9 @@ def create_pdf(resume_text, full_name):
     
     normal_style = ParagraphStyle(
         'NormalStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=10,
-        spaceAfter=4,
+        spaceAfter=10,
         alignment=TA_LEFT,
         fontName='Helvetica',
         leading=12
@@ -167,142 +283,192 @@ def create_pdf(resume_text, full_name):
     
     bullet_style = ParagraphStyle(
         'BulletStyle',
-        parent=styles['Normal'],
+        parent=sample_styles['Normal'],
         fontSize=10,
-        spaceAfter=3,
+        spaceAfter=9,
         leftIndent=20,
         fontName='Helvetica',
         leading=12
     )
     
+    return {
+        'name': name_style,
+        'contact': contact_style,
+        'heading': heading_style,
+        'subheading': subheading_style,
+        'normal': normal_style,
+        'bullet': bullet_style
+    }
+
+# Function to create PDF bytes from resume text
+def create_pdf(resume_text):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                           rightMargin=0.75*inch, leftMargin=0.75*inch,
+                           topMargin=0.75*inch, bottomMargin=0.75*inch)
+    
+    # Container for the 'Flowable' objects
+    elements = []
+    
+    # Flush a run of same-style lines as a single Paragraph
+    def append_block(block_lines, style):
+        if block_lines:
+            elements.append(Paragraph('<br/>'.join(block_lines), style))
+    
+    # Shared paragraph styles
+    styles = get_pdf_styles()
+    
     # Split resume into lines and process
     lines = resume_text.split('\n')
     is_first_line = True
     is_second_line = False
     
+    # Contiguous bullet/normal lines are collected and laid out as one Paragraph
+    block_lines = []
+    block_style = None
+    
     for i, line in enumerate(lines):
         line = line.strip()
         
+        # Blank lines end the current block; spacing comes from the styles
         if not line:
-            elements.append(Spacer(1, 0.08*inch))
+            append_block(block_lines, block_style)
+            block_lines = []
             continue
         
         # Escape special characters for reportlab
-        line_escaped = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        line_escaped = escape(line, quote=False)
         
         # First line (Name)
         if is_first_line and len(line) < 80:
-            elements.append(Paragraph(line_escaped, name_style))
+            elements.append(Paragraph(line_escaped, styles['name']))
             is_first_line = False
             is_second_line = True
             continue
         
         # Second line (Contact info)
         if is_second_line and '|' in line:
-            elements.append(Paragraph(line_escaped, contact_style))
+            elements.append(Paragraph(line_escaped, styles['contact']))
             is_second_line = False
             continue
         
-        # Section headers (ALL CAPS)
-        if line.isupper() and len(line) > 3 and len(line) < 50:
-            elements.append(Paragraph(line_escaped, heading_style))
-        # Job titles or subheadings (contains em dash —)
-        elif '—' in line and not line.startswith('•'):
-            elements.append(Paragraph(line_escaped, subheading_style))
-        # Bullet points
-        elif line.startswith('•'):
-            elements.append(Paragraph(line_escaped, bullet_style))
-        # Location and date lines (contains |)
-        elif '|' in line and any(month in line for month in ['01/', '02/', '03/', '04/', '05/', '06/', '07/', '08/', '09/', '10/', '11/', '12/', 'Present', 'Expected']):
-            elements.append(Paragraph(line_escaped, normal_style))
-        # Normal text
+        # Section headers (ALL CAPS), job titles or subheadings (contains em
+        # dash —), bullet points, and normal text (including location/date lines)
+        is_bullet = line.startswith('•')
+        kind = ('heading' if line.isupper() and 3 < len(line) < 50
+                else 'subheading' if '—' in line and not is_bullet
+                else 'bullet' if is_bullet
+                else 'normal')
+        style = styles[kind]
+        
+        if kind == 'bullet' or kind == 'normal':
+            if style is not block_style:
+                append_block(block_lines, block_style)
+                block_lines = []
+                block_style = style
+            block_lines.append(line_escaped)
         else:
-            elements.append(Paragraph(line_escaped, normal_style))
+            append_block(block_lines, block_style)
+            block_lines = []
+            elements.append(Paragraph(line_escaped, style))
+    
+    append_block(block_lines, block_style)
     
     # Build PDF
     doc.build(elements)
-    buffer.seek(0)
-    return buffer
-
-# Create two columns for better layout
-col1, col2 = st.columns([1, 1])
-
-with col1:
-    st.markdown('<div class="section-header">👤 Personal Information</div>', unsafe_allow_html=True)
-    
-    full_name = st.text_input("Full Name *", placeholder="John Doe")
-    email = st.text_input("Email *", placeholder="john.doe@email.com")
-    phone = st.text_input("Phone Number *", placeholder="+1 (555) 123-4567")
-    location = st.text_input("Location *", placeholder="New York, NY")
-    linkedin = st.text_input("LinkedIn Profile (Optional)", placeholder="linkedin.com/in/johndoe")
-    github = st.text_input("GitHub Profile (Optional)", placeholder="github.com/johndoe")
-    portfolio = st.text_input("Portfolio/Website (Optional)", placeholder="johndoe.com")
-    
-    st.markdown('<div class="section-header">🎓 Education</div>', unsafe_allow_html=True)
-    education = st.text_area(
-        "Education Details *",
-        placeholder="Example:\nBachelor of Science in Computer Science — University of California, Berkeley\n08/2016 – 05/2020\nGPA: 3.8/4.0",
-        height=120
-    )
+    return buffer.getvalue()
+
+# Cache the rendered PDF so reruns after generation skip the ReportLab build
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def build_pdf_bytes(resume_text):
+    return create_pdf(resume_text)
 
-with col2:
-    st.markdown('<div class="section-header">💼 Target Job</div>', unsafe_allow_html=True)
+# Collect all inputs in one form so typing doesn't rerun the script;
+# the app only reruns once, when the form is submitted
+with st.form("resume_form"):
+    # Create two columns for better layout
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown('<div class="section-header">👤 Personal Information</div>', unsafe_allow_html=True)
     
-    job_title = st.text_input("Target Job Title *", placeholder="Senior Software Engineer")
-    job_description = st.text_area(
-        "Job Description *",
-        placeholder="Paste the complete job description here...",
-        height=200
-    )
+        full_name = st.text_input("Full Name *", placeholder="John Doe")
+        email = st.text_input("Email *", placeholder="john.doe@email.com")
+        phone = st.text_input("Phone Number *", placeholder="+1 (555) 123-4567")
+        location = st.text_input("Location *", placeholder="New York, NY")
+        linkedin = st.text_input("LinkedIn Profile (Optional)", placeholder="linkedin.com/in/johndoe")
+        github = st.text_input("GitHub Profile (Optional)", placeholder="github.com/johndoe")
+        portfolio = st.text_input("Portfolio/Website (Optional)", placeholder="johndoe.com")
     
-    st.markdown('<div class="section-header">💡 Professional Summary</div>', unsafe_allow_html=True)
-    professional_summary = st.text_area(
-        "Brief Professional Summary (Optional)",
-        placeholder="A brief overview of your professional background...",
-        height=100
-    )
+        st.markdown('<div class="section-header">🎓 Education</div>', unsafe_allow_html=True)
+        education = st.text_area(
+            "Education Details *",
+            placeholder="Example:\nBachelor of Science in Computer Science — University of California, Berkeley\n08/2016 – 05/2020\nGPA: 3.8/4.0",
+            height=120
+        )
 
-st.markdown('<div class="section-header">🛠️ Skills</div>', unsafe_allow_html=True)
-skills = st.text_area(
-    "Your Skills *",
-    placeholder="Example:\nProgramming Languages: Python, JavaScript, Java, C++\nFrameworks & Libraries: React, Django, Flask, FastAPI, Node.js\nDatabases: PostgreSQL, MongoDB, MySQL, Redis\nCloud & DevOps: AWS, Azure, Docker, Kubernetes, CI/CD\nTools: Git, Postman, VS Code, Linux\nSoft Skills: Leadership, Problem-solving, Team Collaboration",
-    height=150
-)
+    with col2:
+        st.markdown('<div class="section-header">💼 Target Job</div>', unsafe_allow_html=True)
+    
+        job_title = st.text_input("Target Job Title *", placeholder="Senior Software Engineer")
+        job_description = st.text_area(
+            "Job Description *",
+            placeholder="Paste the complete job description here...",
+            height=200
+        )
+    
+        st.markdown('<div class="section-header">💡 Professional Summary</div>', unsafe_allow_html=True)
+        professional_summary = st.text_area(
+            "Brief Professional Summary (Optional)",
+            placeholder="A brief overview of your professional background...",
+            height=100
+        )
 
-st.markdown('<div class="section-header">💼 Work Experience</div>', unsafe_allow_html=True)
-work_experience = st.text_area(
-    "Work Experience *",
-    placeholder="Example:\n\nSoftware Engineer — Tech Corp Inc\nSan Francisco, CA | 06/2020 – Present\n• Built and deployed RESTful APIs with Python/FastAPI serving 10K+ monthly users\n• Integrated authentication, rate limiting, and logging using industry standards\n• Improved response latency by 40% by optimizing query structure and caching\n• Collaborated with frontend and data teams to deliver production-grade features\n\nJunior Developer — StartUp XYZ\nNew York, NY | 01/2018 – 05/2020\n• Designed microservices for AI-powered document processing pipeline\n• Automated CI/CD using GitHub Actions and Docker for seamless deploys",
-    height=250
-)
+    st.markdown('<div class="section-header">🛠️ Skills</div>', unsafe_allow_html=True)
+    skills = st.text_area(
+        "Your Skills *",
+        placeholder="Example:\nProgramming Languages: Python, JavaScript, Java, C++\nFrameworks & Libraries: React, Django, Flask, FastAPI, Node.js\nDatabases: PostgreSQL, MongoDB, MySQL, Redis\nCloud & DevOps: AWS, Azure, Docker, Kubernetes, CI/CD\nTools: Git, Postman, VS Code, Linux\nSoft Skills: Leadership, Problem-solving, Team Collaboration",
+        height=150
+    )
 
-st.markdown('<div class="section-header">🚀 Projects</div>', unsafe_allow_html=True)
-projects = st.text_area(
-    "Key Projects *",
-    placeholder="Example:\n\nAI Speech Transcription API — Full Stack Developer\n• Built AI-based speech transcription API using wav2vec2 + FastAPI + SQLite\n• Added token-based access, rate limiting, and an admin dashboard with analytics\n• Deployed on AWS EC2 with 99.9% uptime serving 5K+ requests daily\n\nRAG Chatbot System — Backend Developer\n• Developed LLM-based RAG chatbot with LangChain and Groq\n• Integrated role-based access for student/admin panels with JSON/MongoDB backend\n• Achieved 85% user satisfaction with response accuracy",
-    height=200
-)
+    st.markdown('<div class="section-header">💼 Work Experience</div>', unsafe_allow_html=True)
+    work_experience = st.text_area(
+        "Work Experience *",
+        placeholder="Example:\n\nSoftware Engineer — Tech Corp Inc\nSan Francisco, CA | 06/2020 – Present\n• Built and deployed RESTful APIs with Python/FastAPI serving 10K+ monthly users\n• Integrated authentication, rate limiting, and logging using industry standards\n• Improved response latency by 40% by optimizing query structure and caching\n• Collaborated with frontend and data teams to deliver production-grade features\n\nJunior Developer — StartUp XYZ\nNew York, NY | 01/2018 – 05/2020\n• Designed microservices for AI-powered document processing pipeline\n• Automated CI/CD using GitHub Actions and Docker for seamless deploys",
+        height=250
+    )
 
-st.markdown('<div class="section-header">🏆 Certifications (Optional)</div>', unsafe_allow_html=True)
-certifications = st.text_area(
-    "Certifications",
-    placeholder="Example:\nAWS Certified Solutions Architect · Azure DP-100 · Google Data Analytics · CompTIA Security+",
-    height=80
-)
+    st.markdown('<div class="section-header">🚀 Projects</div>', unsafe_allow_html=True)
+    projects = st.text_area(
+        "Key Projects *",
+        placeholder="Example:\n\nAI Speech Transcription API — Full Stack Developer\n• Built AI-based speech transcription API using wav2vec2 + FastAPI + SQLite\n• Added token-based access, rate limiting, and an admin dashboard with analytics\n• Deployed on AWS EC2 with 99.9% uptime serving 5K+ requests daily\n\nRAG Chatbot System — Backend Developer\n• Developed LLM-based RAG chatbot with LangChain and Groq\n• Integrated role-based access for student/admin panels with JSON/MongoDB backend\n• Achieved 85% user satisfaction with response accuracy",
+        height=200
+    )
 
-st.markdown('<div class="section-header">🌟 Achievements (Optional)</div>', unsafe_allow_html=True)
-achievements = st.text_area(
-    "Notable Achievements",
-    placeholder="Example:\n• Published 3 AI-based projects on GitHub with 100+ stars\n• Ranked Top 1% in Kaggle Competition XYZ\n• Winner of ABC Hackathon 2023\n• Contributed to open-source projects with 50+ merged PRs\n• Mentored 10+ junior developers",
-    height=120
-)
+    st.markdown('<div class="section-header">🏆 Certifications (Optional)</div>', unsafe_allow_html=True)
+    certifications = st.text_area(
+        "Certifications",
+        placeholder="Example:\nAWS Certified Solutions Architect · Azure DP-100 · Google Data Analytics · CompTIA Security+",
+        height=80
+    )
 
-# Generate Resume Button
-st.markdown("---")
-col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
+    st.markdown('<div class="section-header">🌟 Achievements (Optional)</div>', unsafe_allow_html=True)
+    achievements = st.text_area(
+        "Notable Achievements",
+        placeholder="Example:\n• Published 3 AI-based projects on GitHub with 100+ stars\n• Ranked Top 1% in Kaggle Competition XYZ\n• Winner of ABC Hackathon 2023\n• Contributed to open-source projects with 50+ merged PRs\n• Mentored 10+ junior developers",
+        height=120
+    )
+
+    # Generate Resume Button
+    st.markdown("---")
+    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
 
-with col_btn2:
-    generate_button = st.button("🚀 Generate ATS-Friendly Resume", use_container_width=True, type="primary")
+    with col_btn2:
+        generate_button = st.form_submit_button("🚀 Generate ATS-Friendly Resume", use_container_width=True, type="primary")
 
 if generate_button:
     # Validate required fields
@@ -326,114 +492,33 @@ if generate_button:
     else:
         with st.spinner("🤖 AI is crafting your ATS-friendly resume..."):
             try:
-                # Create the prompt template
-                resume_prompt = PromptTemplate(
-                    input_variables=[
-                        "full_name", "email", "phone", "location", "linkedin", "portfolio",
-                        "job_title", "job_description", "professional_summary", "education",
-                        "skills", "work_experience", "projects", "certifications"
-                    ],
-                    template="""You are an expert resume writer specializing in ATS (Applicant Tracking System) optimization. 
-Create a professional, ATS-friendly resume following this EXACT format and structure:
-
-**STRICT FORMATTING REQUIREMENTS:**
-1. Name at top in ALL CAPS
-2. Contact line: City, Country | Phone | Email | LinkedIn | Portfolio/GitHub (if provided)
-3. Section headers in ALL CAPS with blank line before
-4. Use bullet points (•) for job responsibilities and achievements
-5. Use em dash (—) for separating job title and company
-6. Use vertical bars (|) for separating location and dates
-7. NO tables, columns, icons, or graphics
-8. Keep it simple, clean, and text-only
-
-**REQUIRED FORMAT:**
-
-{full_name}
-{location} | {phone} | {email} | {linkedin} | {portfolio}
-
-PROFESSIONAL SUMMARY
-Write 2-4 lines based on: {professional_summary}
-If not provided, create a compelling summary highlighting experience for {job_title} role using keywords from job description.
-
-CORE SKILLS
-Extract and list relevant skills from: {skills}
-Format: Skill1 · Skill2 · Skill3 · Skill4 (use middle dot · as separator)
-Prioritize skills matching the job description: {job_description}
-
-PROFESSIONAL EXPERIENCE
-Format work experience from: {work_experience}
-Use this structure:
-Job Title — Company Name
-Location | MM/YYYY – Present (or MM/YYYY – MM/YYYY)
-• Achievement/responsibility with metrics
-• Achievement/responsibility with metrics
-• Achievement/responsibility with metrics
-• Achievement/responsibility with metrics
-
-PROJECTS
-Format projects from: {projects}
-Use this structure:
-Project Name — Role
-• Brief description with technologies used
-• Key features and achievements with metrics if available
-
-EDUCATION
-Format education from: {education}
-Use this structure:
-Degree — University Name
-MM/YYYY – MM/YYYY (or Expected MM/YYYY)
-
-CERTIFICATIONS
-List certifications from: {certifications}
-Format: Certification1 · Certification2 · Certification3
-
-ACHIEVEMENTS (if notable achievements exist)
-List any significant achievements, rankings, or recognitions
-
-**CRITICAL INSTRUCTIONS:**
-- Analyze the job description and naturally incorporate relevant keywords
-- Use action verbs: Built, Developed, Implemented, Designed, Improved, Led, etc.
-- Include metrics and numbers wherever possible (%, $, time saved, users, etc.)
-- Keep bullet points concise (1-2 lines max)
-- Ensure proper spacing between sections
-- Use consistent formatting throughout
-- Make it ATS-friendly (no special characters except · — | • )
-
-Job Description for keyword optimization:
-{job_description}
-
-Generate the complete resume now following this exact format."""
-                )
-                
-                # Create the output parser
-                output_parser = StrOutputParser()
-                
-                # Create and run the chain using RunnableSequence
-                chain = RunnableSequence(resume_prompt | llm | output_parser)
-                
-                # Prepare input data
+                # Prepare input data; the contact line is joined here from the
+                # fields that were filled in, and blank optional fields are
+                # sent as "Not provided"
+                contact_parts = (location, phone, email, linkedin, portfolio)
+                optional_fields = {
+                    "professional_summary": professional_summary,
+                    "certifications": certifications
+                }
                 input_data = {
                     "full_name": full_name,
-                    "email": email,
-                    "phone": phone,
-                    "location": location,
-                    "linkedin": linkedin if linkedin else "Not provided",
-                    "portfolio": portfolio if portfolio else "Not provided",
+                    "contact_line": " | ".join(part.strip() for part in contact_parts if part.strip()),
                     "job_title": job_title,
                     "job_description": job_description,
-                    "professional_summary": professional_summary if professional_summary else "Not provided",
                     "education": education,
                     "skills": skills,
                     "work_experience": work_experience,
                     "projects": projects,
-                    "certifications": certifications if certifications else "Not provided"
+                    **{key: value.strip() or "Not provided" for key, value in optional_fields.items()}
                 }
                 
-                # Invoke the chain
-                resume_output = chain.invoke(input_data)
+                # Stream the model output so the resume appears as it is written
+                resume_output = generate_resume(
+                    groq_api_key, MODEL_NAME, tuple(sorted(input_data.items())), st.empty()
+                )
                 
                 # Check if response is blocked by content moderation
-                if resume_output and resume_output.strip().lower() in ['safe', 'unsafe', '']:
+                if resume_output and is_moderation_output(resume_output):
                     st.error("❌ Content moderation triggered. Try rephrasing your input or use a different model.")
                     st.info("💡 Tip: Try removing any unusual characters or sensitive information from your inputs.")
                 else:
@@ -473,10 +558,15 @@ if st.session_state.resume_generated and st.session_state.generated_resume:
     with col_dl3:
         # Generate PDF
         try:
-            pdf_buffer = create_pdf(st.session_state.generated_resume, full_name)
+            # Only rebuild when the resume changed since the last PDF; the
+            # name only affects the filename below
+            pdf_key = st.session_state.generated_resume
+            if st.session_state.pdf_key != pdf_key:
+                st.session_state.pdf_bytes = build_pdf_bytes(pdf_key)
+                st.session_state.pdf_key = pdf_key
             st.download_button(
                 label="📄 Download as PDF",
-                data=pdf_buffer,
+                data=st.session_state.pdf_bytes,
                 file_name=f"ATS_Resume_{full_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
                 mime="application/pdf",
                 use_container_width=True
@@ -514,6 +604,6 @@ if st.session_state.resume_generated and st.session_state.generated_resume:
 st.markdown("---")
 st.markdown("""
     <div style='text-align: center; color: #7f8c8d; padding: 1rem;'>
-        <p>💼 Built with Streamlit & LangChain | Powered by GROQ API</p>
+        <p>💼 Built with Streamlit | Powered by GROQ API</p>
     </div>
 """, unsafe_allow_html=True)
\ No newline at end of file